@@ -2,131 +2,286 @@
 # chaosec.py - A traffic obfuscation tool for Securonis Linux
 
 import argparse
+import array
+import asyncio
 import random
 import socket
-import threading
-import time
-import requests
-import dns.resolver
+import aiohttp
+import aiodns
+import numpy as np
 import os
+import time
 import sys
 import signal
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple
 from datetime import datetime
-import ipaddress
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# uvloop is a drop-in, much faster event loop; use it on Linux when available
+if uvloop is not None and sys.platform.startswith("linux"):
+    uvloop.install()
 
-# Configure logging
+# Configure logging; the raw record time skips asctime's strftime per record
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
+    style='%',
+    format='%(created).3f - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger('chaosec')
 
-# Global flag to control threads
-running = True
+# Upper bound on in-flight requests per generator at ratio 1.0 and intensity 1.0x
+MAX_WORKERS = 100
+
+# Number of public IPs pre-generated as UDP noise destinations
+IP_POOL_SIZE = 10000
+
+# Random picks, coin flips and pauses are drawn this many at a time with numpy
+BATCH_SIZE = 1024
+
+# 1 MiB of kernel randomness; UDP payloads are random windows into it
+_RAND_POOL = os.urandom(1 << 20)
+
+# Answers are reused for DNS_CACHE_TTL seconds, keeping at most DNS_CACHE_SIZE
+DNS_CACHE_TTL = 300
+DNS_CACHE_SIZE = 1024
+
+# Protocol slots in the ChaosecTool._stats counter array
+_DNS, _HTTP, _TCP, _UDP = 0, 1, 2, 3
+
+# Pause after a failed request so a fast-failing peer can't flood the event loop
+ERROR_BACKOFF = 1.0
+
+# Domains queried by the DNS noise generator
+_DOMAINS = (
+    "google.com", "facebook.com", "amazon.com", "github.com", 
+    "wikipedia.org", "twitter.com", "instagram.com", "reddit.com",
+    "netflix.com", "youtube.com", "twitch.tv", "apple.com",
+    "microsoft.com", "yahoo.com", "cloudflare.com", "akamai.com",
+    "gitlab.com", "medium.com", "spotify.com", "mozilla.org",
+    "stackoverflow.com", "debian.org", "ubuntu.com", "archlinux.org",
+    "linux.org", "kernel.org", "gnu.org", "python.org",
+    "rust-lang.org", "golang.org", "nasa.gov"
+)
+
+# Add random subdomains for more realism
+_SUBDOMAINS = ("www", "mail", "api", "blog", "shop", "store", "dev", "admin", 
+               "cdn", "img", "media", "video", "static", "app", "mobile", "m")
+
+# every subdomain name built once so the DNS loop only picks from tuples
+_SUBDOMAIN_NAMES = tuple(f"{subdomain}.{domain}" for subdomain in _SUBDOMAINS for domain in _DOMAINS)
+_QTYPES = ('A', 'AAAA', 'MX', 'TXT', 'NS')
+
+# Safe sites and browser user agents for HTTP noise
+_URLS = (
+    "https://httpbin.org/get", "https://en.wikipedia.org/wiki/Special:Random",
+    "https://www.eff.org", "https://www.torproject.org",
+    "https://www.mozilla.org", "https://www.kernel.org",
+    "https://www.debian.org", "https://www.ubuntu.com", 
+    "https://www.archlinux.org", "https://www.python.org",
+    "https://www.rust-lang.org", "https://www.gnu.org",
+    "https://www.fsf.org", "https://www.linuxfoundation.org",
+    "https://www.opensuse.org", "https://www.redhat.com",
+    "https://www.kali.org", "https://www.gnome.org"
+)
+
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64; rv:89.0) Gecko/20100101 Firefox/89.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.131 Safari/537.36 Edg/92.0.902.67",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1"
+)
+
+# TCP noise destinations; HTTP-like requests are only sent on _HTTP_PORTS
+_TCP_PORTS = (80, 443, 8080, 8443, 22, 25, 143, 993, 587, 110, 995)
+_HTTP_PORTS = frozenset((80, 443, 8080, 8443))
+_TCP_TARGETS = (
+    "mozilla.org", "kernel.org",
+    "debian.org", "ubuntu.com", "archlinux.org", 
+    "python.org", "rust-lang.org", "golang.org",
+    "gnu.org", "fsf.org", "linuxfoundation.org",
+    "opensuse.org", "redhat.com", "kali.org"
+)
+
+# HTTP-like requests to make the traffic look more realistic
+_HTTP_REQUESTS = (
+    b"GET / HTTP/1.1\r\nHost: %b\r\nUser-Agent: Mozilla/5.0\r\n\r\n",
+    b"HEAD / HTTP/1.1\r\nHost: %b\r\nUser-Agent: Chrome/92.0\r\n\r\n",
+    b"GET /index.html HTTP/1.1\r\nHost: %b\r\nUser-Agent: Firefox/89.0\r\n\r\n",
+    b"GET /about HTTP/1.1\r\nHost: %b\r\nUser-Agent: Safari/605.1\r\n\r\n"
+)
+
+# Common UDP ports: DNS, NTP, SNMP, gaming ports, etc.
+_UDP_PORTS = (53, 123, 161, 162, 1900, 5353, 27015, 3478, 3479)
+
+# Packet payloads for different protocols
+_DNS_PAYLOAD = b"\x00\x01\x01\x00\x00\x01\x00\x00\x00\x00\x00\x00\x03www\x07mozilla\x03org\x00\x00\x01\x00\x01"
+_NTP_PAYLOAD = b"\x1b" + b"\0" * 47  # NTP request mode 3
+
+class Pattern(NamedTuple):
+    """Per-protocol traffic ratios and the request interval range in seconds"""
+    http_ratio: float
+    dns_ratio: float
+    tcp_ratio: float
+    udp_ratio: float
+    interval_min: float
+    interval_max: float
 
 # Traffic patterns 
 TRAFFIC_PATTERNS = {
-    "browsing": {
-        "http_ratio": 0.6,
-        "dns_ratio": 0.3,
-        "tcp_ratio": 0.1,
-        "udp_ratio": 0.05,
-        "interval_min": 1.0,
-        "interval_max": 8.0
-    },
-    "streaming": {
-        "http_ratio": 0.8,
-        "dns_ratio": 0.1,
-        "tcp_ratio": 0.05,
-        "udp_ratio": 0.2,
-        "interval_min": 0.5,
-        "interval_max": 2.0
-    },
-    "gaming": {
-        "http_ratio": 0.2,
-        "dns_ratio": 0.1,
-        "tcp_ratio": 0.3,
-        "udp_ratio": 0.5,
-        "interval_min": 0.1,
-        "interval_max": 1.0
-    },
-    "chaotic": {
-        "http_ratio": 1.0,
-        "dns_ratio": 1.0,
-        "tcp_ratio": 1.0,
-        "udp_ratio": 1.0,
-        "interval_min": 0.1,
-        "interval_max": 0.5
-    }
+    "browsing": Pattern(
+        http_ratio=0.6,
+        dns_ratio=0.3,
+        tcp_ratio=0.1,
+        udp_ratio=0.05,
+        interval_min=1.0,
+        interval_max=8.0
+    ),
+    "streaming": Pattern(
+        http_ratio=0.8,
+        dns_ratio=0.1,
+        tcp_ratio=0.05,
+        udp_ratio=0.2,
+        interval_min=0.5,
+        interval_max=2.0
+    ),
+    "gaming": Pattern(
+        http_ratio=0.2,
+        dns_ratio=0.1,
+        tcp_ratio=0.3,
+        udp_ratio=0.5,
+        interval_min=0.1,
+        interval_max=1.0
+    ),
+    "chaotic": Pattern(
+        http_ratio=1.0,
+        dns_ratio=1.0,
+        tcp_ratio=1.0,
+        udp_ratio=1.0,
+        interval_min=0.1,
+        interval_max=0.5
+    )
 }
 
 class ChaosecTool:
     def __init__(self):
-        self.threads = []
+        self.tasks = []
         self.intensity = 1.0  # Default intensity multiplier
         self.pattern = "browsing"  # Default traffic pattern
         self.tor_mode = False  # If we're running under Tor (for patterns)
-        self.stats = {"dns": 0, "http": 0, "tcp": 0, "udp": 0}
+        self._stats = array.array('q', [0] * 4)  # Indexed by _DNS, _HTTP, _TCP, _UDP
+        self.semaphores = {}  # Per-protocol worker pools, sized in _main
+        self._inflight = set()  # Strong refs to running request tasks
+        self._stop = None  # Set by stop(); created in _main on the running loop
+        self._dns = None  # c-ares resolver, bound to the event loop in _main
+        self._dns_cache = {}  # (domain, qtype) -> (monotonic time, answer)
+        self._resolve_pool = None  # getaddrinfo threads for TCP noise, sized in _main
+        self._rng = np.random.default_rng()  # Batch RNG for the generator loops
+        
+        # every HTTP-like TCP request rendered once per target
+        self._req_cache = {
+            target: [template % target.encode() for template in _HTTP_REQUESTS]
+            for target in _TCP_TARGETS
+        }
+        self._ip_pool = []  # Public IPs for UDP noise, filled in _main
+        self._now = str(datetime.now())  # POST timestamp, refreshed once per second
+        
+        # UDP is connectionless, so one socket can sendto() every destination
+        self._udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._udp_sock.setblocking(False)
         
     def start(self, args):
         """Start noise generation based on provided arguments"""
+        asyncio.run(self._main(args))
+
+    async def _main(self, args):
+        """Run the selected noise generators concurrently on one event loop"""
         # Set intensity and pattern
         self.intensity = args.intensity
         self.pattern = args.pattern
         self.tor_mode = args.tor_mode
+        self._stop = asyncio.Event()
+        
+        # Cache the pattern values so the generators skip the attribute lookups
+        self._p = TRAFFIC_PATTERNS[self.pattern]
+        self._imin = self._p.interval_min
+        self._imax = self._p.interval_max
+        self._http_r = self._p.http_ratio
+        self._dns_r = self._p.dns_ratio
+        self._tcp_r = self._p.tcp_ratio
+        self._udp_r = self._p.udp_ratio
+        
+        # Size each protocol's worker pool from the pattern ratio and intensity
+        ratios = {"dns": self._dns_r, "http": self._http_r, "tcp": self._tcp_r}
+        for proto, ratio in ratios.items():
+            max_inflight = max(1, int(ratio * self.intensity * MAX_WORKERS))
+            self.semaphores[proto] = asyncio.Semaphore(max_inflight)
         
         # Show banner and startup info
         self._show_banner(args)
         
+        # setup signal handlers for graceful shutdown
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, signal_handler, self)
+        
         # Start appropriate noise generators
         if args.dns_noise:
-            thread = threading.Thread(target=self.generate_dns_noise)
-            thread.daemon = True
-            thread.start()
-            self.threads.append(thread)
+            self.tasks.append(asyncio.create_task(self.generate_dns_noise()))
             logger.info("DNS noise generator active")
             
         if args.http_flood:
-            thread = threading.Thread(target=self.generate_http_noise)
-            thread.daemon = True
-            thread.start()
-            self.threads.append(thread)
+            self.tasks.append(asyncio.create_task(self._refresh_clock()))
+            self.tasks.append(asyncio.create_task(self.generate_http_noise()))
             logger.info("HTTP traffic generator active")
             
         if args.tcp_noise:
-            thread = threading.Thread(target=self.generate_tcp_noise)
-            thread.daemon = True
-            thread.start()
-            self.threads.append(thread)
+            # dedicated lookup threads so slow resolution can't starve the
+            # loop's default executor, scaled with intensity
+            self._resolve_pool = ThreadPoolExecutor(
+                max_workers=max(1, int(20 * self.intensity)), thread_name_prefix="resolve"
+            )
+            self.tasks.append(asyncio.create_task(self.generate_tcp_noise()))
             logger.info("TCP connection noise active")
             
         if args.udp_noise:
-            thread = threading.Thread(target=self.generate_udp_noise)
-            thread.daemon = True
-            thread.start()
-            self.threads.append(thread)
+            # draw destinations up front instead of validating one per packet
+            self._ip_pool = [get_random_ip() for _ in range(IP_POOL_SIZE)]
+            self.tasks.append(asyncio.create_task(self.generate_udp_noise()))
             logger.info("UDP packet noise active")
             
-        # Start statistics thread if verbose
+        # Start statistics task if verbose
         if args.verbose:
-            thread = threading.Thread(target=self._print_stats)
-            thread.daemon = True
-            thread.start()
-            self.threads.append(thread)
+            self.tasks.append(asyncio.create_task(self._print_stats()))
         
         if not (args.dns_noise or args.http_flood or args.tcp_noise or args.udp_noise):
             logger.warning("No noise generators selected. Use --help for options.")
             return
             
-        # Keep the main thread alive
+        # c-ares resolver shared by all DNS queries; it needs the running loop,
+        # and the generator tasks only touch it once we start awaiting below
+        self._dns = aiodns.DNSResolver(timeout=2, tries=1)
+        
+        # Run until stop() sets the event, then tear everything down at once
         try:
-            while running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            self.stop()
+            await self._stop.wait()
+        finally:
+            pending = self.tasks + list(self._inflight)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await self._dns.close()
+            self._udp_sock.close()
+            if self._resolve_pool is not None:
+                self._resolve_pool.shutdown(wait=False, cancel_futures=True)
+        logger.info("Chaosec stopped successfully")
     
     def _show_banner(self, args):
         """Display the startup banner with information"""
@@ -142,283 +297,348 @@ class ChaosecTool:
         print(banner)
         
         # Show running configuration
-        logger.info(f"Starting with pattern: {self.pattern}, intensity: {self.intensity}x")
-        logger.info(f"Active modules: " + 
-              ("DNS " if args.dns_noise else "") +
-              ("HTTP " if args.http_flood else "") +
-              ("TCP " if args.tcp_noise else "") +
-              ("UDP " if args.udp_noise else ""))
+        logger.info("Starting with pattern: %s, intensity: %sx", self.pattern, self.intensity)
+        logger.info("Active modules: %s%s%s%s",
+              "DNS " if args.dns_noise else "",
+              "HTTP " if args.http_flood else "",
+              "TCP " if args.tcp_noise else "",
+              "UDP " if args.udp_noise else "")
         
         if self.tor_mode:
             logger.info("Tor mode: Active - Traffic will be optimized for Tor network")
         
-    def _print_stats(self):
+    async def _refresh_clock(self):
+        """Refresh the cached POST timestamp; it only has to look realistic"""
+        while not self._stop.is_set():
+            self._now = str(datetime.now())
+            await asyncio.sleep(1)
+            
+    async def _print_stats(self):
         """Print stats periodically if verbose mode is on"""
-        while running:
-            time.sleep(10)  # Update stats every 10 seconds
-            logger.info(f"Traffic stats (last 10s): DNS:{self.stats['dns']} HTTP:{self.stats['http']} TCP:{self.stats['tcp']} UDP:{self.stats['udp']}")
-            self.stats = {"dns": 0, "http": 0, "tcp": 0, "udp": 0}  # Reset counters
+        while not self._stop.is_set():
+            await asyncio.sleep(10)  # Update stats every 10 seconds
+            snap = tuple(self._stats)
+            self._stats[:] = array.array('q', [0] * 4)  # Reset counters
+            logger.info("Traffic stats (last 10s): DNS:%d HTTP:%d TCP:%d UDP:%d",
+                        snap[_DNS], snap[_HTTP], snap[_TCP], snap[_UDP])
             
     def stop(self):
-        """Stop all noise generation threads"""
-        global running
-        running = False
+        """Stop all noise generation tasks"""
         logger.info("Stopping all noise generators...")
         
-        # Wait for threads to finish
-        for thread in self.threads:
-            thread.join(timeout=1.0)
-        logger.info("Chaosec stopped successfully")
+        # Wake _main, which cancels any generator or request still pending
+        self._stop.set()
+        
+    def _spawn(self, sem, request):
+        """Run a request in the background, returning its slot to sem when done"""
+        task = asyncio.create_task(self._run_slot(sem, request))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
         
-    def generate_dns_noise(self):
+    async def _run_slot(self, sem, request):
+        """Await a single noise request while holding a worker slot"""
+        try:
+            await request
+        except Exception:
+            # Just continue if the request fails, but hold the slot a while
+            await asyncio.sleep(ERROR_BACKOFF)
+        finally:
+            sem.release()
+            
+    async def generate_dns_noise(self):
         """Generate random DNS queries to confuse traffic analysis"""
-        domains = [
-            "google.com", "facebook.com", "amazon.com", "github.com", 
-            "wikipedia.org", "twitter.com", "instagram.com", "reddit.com",
-            "netflix.com", "youtube.com", "twitch.tv", "apple.com",
-            "microsoft.com", "yahoo.com", "cloudflare.com", "akamai.com",
-            "gitlab.com", "medium.com", "spotify.com", "mozilla.org",
-            "stackoverflow.com", "debian.org", "ubuntu.com", "archlinux.org",
-            "linux.org", "kernel.org", "gnu.org", "python.org",
-            "rust-lang.org", "golang.org", "nasa.gov"
-        ]
+        # hoist loop invariants into locals
+        sem = self.semaphores["dns"]
+        imin, imax = self._imin, self._imax
+        intensity, tor_mode = self.intensity, self.tor_mode
+        stopped = self._stop.is_set
+        rng = self._rng
         
-        # Add random subdomains for more realism
-        subdomains = ["www", "mail", "api", "blog", "shop", "store", "dev", "admin", 
-                      "cdn", "img", "media", "video", "static", "app", "mobile", "m"]
+        i = BATCH_SIZE
+        while not stopped():
+            # refill the pick buffers once per batch
+            if i == BATCH_SIZE:
+                sub_buf = pick_batch(rng, _SUBDOMAIN_NAMES, BATCH_SIZE)
+                domain_buf = pick_batch(rng, _DOMAINS, BATCH_SIZE)
+                qtype_buf = pick_batch(rng, _QTYPES, BATCH_SIZE)
+                coin_buf = rng.random(BATCH_SIZE).tolist()
+                sleep_buf = next_sleeps(rng, imin, imax, intensity, tor_mode, BATCH_SIZE)
+                i = 0
+            
+            # sometimes use a subdomain
+            if coin_buf[i] > 0.5:
+                domain = sub_buf[i]
+            else:
+                domain = domain_buf[i]
+                
+            # mix up query types
+            qtype = qtype_buf[i]
+            sleep_time = sleep_buf[i]
+            i += 1
+            
+            # wait for a free worker slot, then query in the background
+            await sem.acquire()
+            self._spawn(sem, self._dns_query(domain, qtype))
+            
+            # apply pattern-based timing
+            await asyncio.sleep(sleep_time)
+            
+    async def _dns_query(self, domain, qtype):
+        """Send a single DNS query unless a fresh answer is already cached"""
+        key = (domain, qtype)
+        now = time.monotonic()
+        cached = self._dns_cache.get(key)
+        if cached is not None and now - cached[0] < DNS_CACHE_TTL:
+            return
         
-        resolver = dns.resolver.Resolver()
+        try:
+            answer = await self._dns.query_dns(domain, qtype)
+        except aiodns.error.DNSError:
+            # NXDOMAIN, timeouts etc. are expected noise, not a reason to back off
+            return
         
-        while running:
-            try:
-                # apply pattern and intensity
-                if random.random() > TRAFFIC_PATTERNS[self.pattern]["dns_ratio"] * self.intensity:
-                    time.sleep(0.1)
-                    continue
-                    
-                # sometimes use a subdomain
-                if random.random() > 0.5:
-                    subdomain = random.choice(subdomains)
-                    domain = f"{subdomain}.{random.choice(domains)}"
-                else:
-                    domain = random.choice(domains)
-                    
-                # mix up query types
-                qtype = random.choice(['A', 'AAAA', 'MX', 'TXT', 'NS'])
-                resolver.resolve(domain, qtype)
-                
-                # update stats
-                self.stats["dns"] += 1
-                
-                # apply pattern-based timing
-                sleep_time = random.uniform(
-                    TRAFFIC_PATTERNS[self.pattern]["interval_min"],
-                    TRAFFIC_PATTERNS[self.pattern]["interval_max"]
-                ) / self.intensity
-                
-                # if in Tor mode, be more conservative with traffic bursts
-                if self.tor_mode and sleep_time < 1.0:
-                    sleep_time = max(sleep_time, 1.0)
-                
-                time.sleep(sleep_time)
-            except Exception:
-                # Just continue if DNS resolution fails
-                pass
+        # evict the oldest entry once full; dicts keep insertion order
+        cache = self._dns_cache
+        cache.pop(key, None)
+        if len(cache) >= DNS_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = (now, answer)
+        
+        # update stats
+        self._stats[_DNS] += 1
                 
-    def generate_http_noise(self):
+    async def generate_http_noise(self):
         """Generate random HTTP requests to various safe sites"""
-        urls = [
-            "https://httpbin.org/get", "https://en.wikipedia.org/wiki/Special:Random",
-            "https://www.eff.org", "https://www.torproject.org",
-            "https://www.mozilla.org", "https://www.kernel.org",
-            "https://www.debian.org", "https://www.ubuntu.com", 
-            "https://www.archlinux.org", "https://www.python.org",
-            "https://www.rust-lang.org", "https://www.gnu.org",
-            "https://www.fsf.org", "https://www.linuxfoundation.org",
-            "https://www.opensuse.org", "https://www.redhat.com",
-            "https://www.kali.org", "https://www.gnome.org"
-        ]
-        
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64; rv:89.0) Gecko/20100101 Firefox/89.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.131 Safari/537.36 Edg/92.0.902.67",
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1"
-        ]
-        
-        # Configure session
-        session = requests.Session()
+        # Configure session; the worker pool bounds total in-flight requests, while
+        # keep-alive connections per host and cached lookups skip repeat
+        # handshakes and DNS queries
+        connector = aiohttp.TCPConnector(
+            limit=0, limit_per_host=8, use_dns_cache=True, ttl_dns_cache=300
+        )
+        timeout = aiohttp.ClientTimeout(total=10)
+        # hoist loop invariants into locals
+        sem = self.semaphores["http"]
+        imin, imax = self._imin, self._imax
+        intensity, tor_mode = self.intensity, self.tor_mode
+        stopped = self._stop.is_set
+        rng = self._rng
         
-        while running:
-            try:
-                # apply pattern and intensity
-                if random.random() > TRAFFIC_PATTERNS[self.pattern]["http_ratio"] * self.intensity:
-                    time.sleep(0.1)
-                    continue
-                    
-                url = random.choice(urls)
-                headers = {"User-Agent": random.choice(user_agents)}
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            i = BATCH_SIZE
+            while not stopped():
+                # refill the pick buffers once per batch
+                if i == BATCH_SIZE:
+                    url_buf = pick_batch(rng, _URLS, BATCH_SIZE)
+                    ua_buf = pick_batch(rng, _USER_AGENTS, BATCH_SIZE)
+                    coin_buf = rng.random(BATCH_SIZE).tolist()
+                    sleep_buf = next_sleeps(rng, imin, imax, intensity, tor_mode, BATCH_SIZE)
+                    i = 0
+                
+                url = url_buf[i]
+                headers = {"User-Agent": ua_buf[i]}
+                coin = coin_buf[i]
+                sleep_time = sleep_buf[i]
+                i += 1
                 
                 # mix GET and POST requests
-                if random.random() > 0.8:
+                if coin > 0.8:
                     # occasionally do a POST
-                    data = {"timestamp": str(datetime.now()), "session": str(random.randint(1000, 9999))}
-                    session.post(url, headers=headers, data=data, timeout=10)
+                    data = {"timestamp": self._now, "session": str(random.getrandbits(13) + 1000)}
                 else:
                     # usually do a GET
-                    session.get(url, headers=headers, timeout=10)
+                    data = None
                 
-                # update stats
-                self.stats["http"] += 1
+                # wait for a free worker slot, then fetch in the background
+                await sem.acquire()
+                self._spawn(sem, self._http_request(session, url, headers, data))
                 
                 # apply pattern-based timing
-                sleep_time = random.uniform(
-                    TRAFFIC_PATTERNS[self.pattern]["interval_min"],
-                    TRAFFIC_PATTERNS[self.pattern]["interval_max"]
-                ) / self.intensity
+                await asyncio.sleep(sleep_time)
                 
-                # if in Tor mode, be more conservative with traffic bursts
-                if self.tor_mode and sleep_time < 1.0:
-                    sleep_time = max(sleep_time, 1.0)
-                
-                time.sleep(sleep_time)
-            except Exception:
-                # Just continue if request fails
-                pass
+    async def _http_request(self, session, url, headers, data):
+        """Send a single GET, or a POST when data is given"""
+        if data is not None:
+            request = session.post(url, headers=headers, data=data)
+        else:
+            request = session.get(url, headers=headers)
+        
+        async with request as resp:
+            await resp.read()
+        
+        # update stats
+        self._stats[_HTTP] += 1
                 
-    def generate_tcp_noise(self):
+    async def generate_tcp_noise(self):
         """Generate random TCP connections to confuse traffic analysis"""
-        common_ports = [80, 443, 8080, 8443, 22, 25, 143, 993, 587, 110, 995]
-        targets = [
-            "mozilla.org", "kernel.org",
-            "debian.org", "ubuntu.com", "archlinux.org", 
-            "python.org", "rust-lang.org", "golang.org",
-            "gnu.org", "fsf.org", "linuxfoundation.org",
-            "opensuse.org", "redhat.com", "kali.org"
-        ]
+        # hoist loop invariants into locals
+        sem = self.semaphores["tcp"]
+        imin, imax = self._imin, self._imax
+        intensity, tor_mode = self.intensity, self.tor_mode
+        stopped = self._stop.is_set
+        req_cache = self._req_cache
+        request_ids = range(len(_HTTP_REQUESTS))
+        rng = self._rng
         
-        # HTTP-like requests to make the traffic look more realistic
-        http_requests = [
-            b"GET / HTTP/1.1\r\nHost: {}\r\nUser-Agent: Mozilla/5.0\r\n\r\n",
-            b"HEAD / HTTP/1.1\r\nHost: {}\r\nUser-Agent: Chrome/92.0\r\n\r\n",
-            b"GET /index.html HTTP/1.1\r\nHost: {}\r\nUser-Agent: Firefox/89.0\r\n\r\n",
-            b"GET /about HTTP/1.1\r\nHost: {}\r\nUser-Agent: Safari/605.1\r\n\r\n"
-        ]
+        i = BATCH_SIZE
+        while not stopped():
+            # refill the pick buffers once per batch
+            if i == BATCH_SIZE:
+                target_buf = pick_batch(rng, _TCP_TARGETS, BATCH_SIZE)
+                port_buf = pick_batch(rng, _TCP_PORTS, BATCH_SIZE)
+                request_buf = pick_batch(rng, request_ids, BATCH_SIZE)
+                sleep_buf = next_sleeps(rng, imin, imax, intensity, tor_mode, BATCH_SIZE)
+                i = 0
+            
+            target = target_buf[i]
+            port = port_buf[i]
+            
+            # send a realistic-looking HTTP request if it's a common HTTP port
+            if port in _HTTP_PORTS:
+                request = req_cache[target][request_buf[i]]
+            else:
+                request = None
+            sleep_time = sleep_buf[i]
+            i += 1
+            
+            # wait for a free worker slot, then connect in the background
+            await sem.acquire()
+            self._spawn(sem, self._tcp_connect(target, port, request))
+            
+            # apply pattern-based timing
+            await asyncio.sleep(sleep_time)
+            
+    async def _tcp_connect(self, target, port, request):
+        """Open a single TCP connection, optionally sending request"""
+        loop = asyncio.get_running_loop()
+        infos = await loop.run_in_executor(
+            self._resolve_pool, socket.getaddrinfo, target, port, socket.AF_INET, socket.SOCK_STREAM
+        )
         
-        while running:
-            try:
-                # apply pattern and intensity
-                if random.random() > TRAFFIC_PATTERNS[self.pattern]["tcp_ratio"] * self.intensity:
-                    time.sleep(0.1)
-                    continue
-                    
-                target = random.choice(targets)
-                port = random.choice(common_ports)
-                
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(5)
-                sock.connect((target, port))
-                
-                # send a realistic-looking HTTP request if it's a common HTTP port
-                if port in [80, 443, 8080, 8443]:
-                    request = random.choice(http_requests)
-                    sock.send(request.format(target.encode()))
-                    
-                    # sometimes read response
-                    if random.random() > 0.7:
-                        sock.recv(4096)
-                
-                sock.close()
-                
-                # update stats
-                self.stats["tcp"] += 1
-                
-                # apply pattern-based timing
-                sleep_time = random.uniform(
-                    TRAFFIC_PATTERNS[self.pattern]["interval_min"],
-                    TRAFFIC_PATTERNS[self.pattern]["interval_max"]
-                ) / self.intensity
+        # a non-blocking connect is parked in the loop's selector (epoll on
+        # Linux) until writable, so many connects proceed in parallel
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            # push the tiny payload out at once and don't hold ports in TIME_WAIT
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.setblocking(False)
+            await asyncio.wait_for(loop.sock_connect(sock, infos[0][4]), timeout=5)
+            
+            if request is not None:
+                await loop.sock_sendall(sock, request)
                 
-                # if in Tor mode, be more conservative with traffic bursts
-                if self.tor_mode and sleep_time < 1.0:
-                    sleep_time = max(sleep_time, 1.0)
+                # half-close so the peer sees a clean FIN
+                sock.shutdown(socket.SHUT_WR)
                 
-                time.sleep(sleep_time)
-            except Exception:
-                # Just continue if connection fails
-                pass
+                # sometimes read response
+                if random.random() > 0.7:
+                    await asyncio.wait_for(loop.sock_recv(sock, 4096), timeout=5)
+        finally:
+            sock.close()
+        
+        # update stats
+        self._stats[_TCP] += 1
     
-    def generate_udp_noise(self):
+    async def generate_udp_noise(self):
         """Generate random UDP packets to various destinations"""
-        # Common UDP ports: DNS, NTP, SNMP, gaming ports, etc.
-        common_ports = [53, 123, 161, 162, 1900, 5353, 27015, 3478, 3479]
-        
-        # Generate random IP addresses that aren't in private ranges
-        def get_random_ip():
-            while True:
-                ip = ".".join(str(random.randint(1, 254)) for _ in range(4))
-                if not ipaddress.ip_address(ip).is_private:
-                    return ip
+        # hoist loop invariants into locals
+        udp_sock = self._udp_sock
+        ip_pool = self._ip_pool
+        imin, imax = self._imin, self._imax
+        intensity, tor_mode = self.intensity, self.tor_mode
+        stopped = self._stop.is_set
+        rng = self._rng
         
-        # Packet payloads for different protocols
-        dns_payload = b"\x00\x01\x01\x00\x00\x01\x00\x00\x00\x00\x00\x00\x03www\x07mozilla\x03org\x00\x00\x01\x00\x01"
-        ntp_payload = b"\x1b" + b"\0" * 47  # NTP request mode 3
-        
-        while running:
+        i = BATCH_SIZE
+        while not stopped():
+            # refill the pick buffers once per batch
+            if i == BATCH_SIZE:
+                port_buf = pick_batch(rng, _UDP_PORTS, BATCH_SIZE)
+                ip_buf = pick_batch(rng, ip_pool, BATCH_SIZE)
+                coin_buf = rng.random(BATCH_SIZE).tolist()
+                size_buf = rng.integers(16, 129, BATCH_SIZE).tolist()
+                offset_buf = rng.integers(0, len(_RAND_POOL) - 128, BATCH_SIZE).tolist()
+                sleep_buf = next_sleeps(rng, imin, imax, intensity, tor_mode, BATCH_SIZE)
+                i = 0
+            
+            # choose port and prepare packet
+            port = port_buf[i]
+            if port == 53:  # DNS
+                payload = _DNS_PAYLOAD
+            elif port == 123:  # NTP
+                payload = _NTP_PAYLOAD
+            else:
+                # random data for other ports, sliced from the pre-drawn pool
+                size = size_buf[i]
+                offset = offset_buf[i]
+                payload = _RAND_POOL[offset:offset + size]
+            
+            # send to random IP or to known servers
+            if coin_buf[i] > 0.5:
+                target_ip = ip_buf[i]
+            else:
+                target_ip = "8.8.8.8"  # Google DNS as an example
+            sleep_time = sleep_buf[i]
+            i += 1
+            
+            # a non-blocking sendto never stays in flight, so no worker slot is needed
             try:
-                # apply pattern and intensity
-                if random.random() > TRAFFIC_PATTERNS[self.pattern]["udp_ratio"] * self.intensity:
-                    time.sleep(0.1)
-                    continue
-                
-                # create a UDP socket
-                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                
-                # choose port and prepare packet
-                port = random.choice(common_ports)
-                if port == 53:  # DNS
-                    payload = dns_payload
-                elif port == 123:  # NTP
-                    payload = ntp_payload
-                else:
-                    # random data for other ports
-                    payload = bytes(random.getrandbits(8) for _ in range(random.randint(16, 128)))
-                
-                # send to random IP or to known servers
-                if random.random() > 0.5:
-                    target_ip = get_random_ip()
-                else:
-                    target_ip = "8.8.8.8"  # Google DNS as an example
-                
-                sock.sendto(payload, (target_ip, port))
-                sock.close()
+                udp_sock.sendto(payload, (target_ip, port))
                 
                 # update stats
-                self.stats["udp"] += 1
-                
-                # apply pattern-based timing
-                sleep_time = random.uniform(
-                    TRAFFIC_PATTERNS[self.pattern]["interval_min"],
-                    TRAFFIC_PATTERNS[self.pattern]["interval_max"]
-                ) / self.intensity
-                
-                # if in Tor mode, be more conservative with traffic bursts
-                if self.tor_mode and sleep_time < 1.0:
-                    sleep_time = max(sleep_time, 1.0)
-                
-                time.sleep(sleep_time)
-            except Exception:
-                # Just continue if sending fails
+                self._stats[_UDP] += 1
+            except BlockingIOError:
+                # send buffer is full; drop this packet
                 pass
+            except OSError:
+                # Just continue if sending fails
+                await asyncio.sleep(ERROR_BACKOFF)
+            
+            # apply pattern-based timing
+            await asyncio.sleep(sleep_time)
+
+def pick_batch(rng, seq, n):
+    """Draw n random items from seq using numpy-generated indices"""
+    return [seq[j] for j in rng.integers(0, len(seq), n).tolist()]
 
-def signal_handler(sig, frame):
+def next_sleeps(rng, imin, imax, intensity, tor_mode, n):
+    """Draw a batch of n pattern-based pauses between requests"""
+    sleeps = rng.uniform(imin, imax, n) / intensity
+    
+    # if in Tor mode, be more conservative with traffic bursts
+    if tor_mode:
+        sleeps = np.maximum(sleeps, 1.0)
+    
+    return sleeps.tolist()
+
+def is_public_u32(ip):
+    """Check an IPv4 address, as a 32-bit int, against the non-routable ranges"""
+    return not (
+        (ip & 0xFF000000) == 0x00000000 or  # 0.0.0.0/8
+        (ip & 0xFF000000) == 0x0A000000 or  # 10.0.0.0/8
+        (ip & 0xFF000000) == 0x7F000000 or  # 127.0.0.0/8
+        (ip & 0xFFFF0000) == 0xA9FE0000 or  # 169.254.0.0/16
+        (ip & 0xFFF00000) == 0xAC100000 or  # 172.16.0.0/12
+        (ip & 0xFFFF0000) == 0xC0A80000 or  # 192.168.0.0/16
+        (ip & 0xFFFFFF00) == 0xC0000000 or  # 192.0.0.0/24
+        (ip & 0xFFFFFF00) == 0xC0000200 or  # 192.0.2.0/24 documentation
+        (ip & 0xFFFE0000) == 0xC6120000 or  # 198.18.0.0/15 benchmarking
+        (ip & 0xFFFFFF00) == 0xC6336400 or  # 198.51.100.0/24 documentation
+        (ip & 0xFFFFFF00) == 0xCB007100 or  # 203.0.113.0/24 documentation
+        (ip & 0xE0000000) == 0xE0000000     # 224.0.0.0/3 multicast and reserved
+    )
+
+def get_random_ip():
+    """Generate a random IP address that isn't in a private range"""
+    while True:
+        ip = random.getrandbits(32)
+        if is_public_u32(ip):
+            return socket.inet_ntoa(ip.to_bytes(4, "big"))
+
+def signal_handler(tool):
     """Handle interrupt signals to gracefully stop the tool"""
-    global running
-    running = False
     logger.info("Interrupt received, shutting down...")
-    sys.exit(0)
+    tool.stop()
 
 def main():
     parser = argparse.ArgumentParser(description="Chaosec - Traffic obfuscation tool for Securonis Linux")
@@ -458,9 +678,6 @@ def main():
     if args.mode == "chaotic" and args.pattern == "browsing":
         args.pattern = "chaotic"
     
-    # setup signal handler for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    
     # start the tool
     tool = ChaosecTool()
     tool.start(args)